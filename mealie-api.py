@@ -25,13 +25,25 @@ The api is documented at:
  uploads and verbose output.
 """
 
+import io
 import sys
 import os
+import re
 import json
 import argparse
+import hashlib
+import mimetypes
+import socket
+import tempfile
 from typing import Optional, Dict, Any
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 
 class Colors:
@@ -44,15 +56,84 @@ class Colors:
     NC = '\033[0m'  # No Color
 
 
-def print_color(color: str, message: str) -> None:
+class KeepAliveAdapter(HTTPAdapter):
+    """HTTP adapter whose pooled sockets also enable TCP keep-alive."""
+
+    # urllib3's defaults already disable Nagle's algorithm (TCP_NODELAY)
+    socket_options = HTTPConnection.default_socket_options + [
+        (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+    ]
+
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs['socket_options'] = self.socket_options
+        super().init_poolmanager(*args, **kwargs)
+
+    def proxy_manager_for(self, proxy, **proxy_kwargs):
+        proxy_kwargs['socket_options'] = self.socket_options
+        return super().proxy_manager_for(proxy, **proxy_kwargs)
+
+
+# Shared session so repeated calls reuse pooled connections instead of
+# paying a fresh TCP/TLS handshake per request. This is HTTP/1.1 only;
+# HTTP/2 multiplexing (e.g. httpx) would only help with concurrent
+# requests, and each invocation makes a single request.
+_SESSION = requests.Session()
+_SESSION.mount('http://', KeepAliveAdapter(pool_connections=4, pool_maxsize=16))
+_SESSION.mount('https://', KeepAliveAdapter(pool_connections=4, pool_maxsize=16))
+
+# Masked display values for Authorization headers, precomputed by configure_session()
+_MASKED_AUTH: Dict[str, str] = {}
+
+# Shell escapes (e.g. "\ ", "\(", "\$") that sometimes end up in JSON payloads
+_SHELL_ESCAPE_RE = re.compile(r'\\([ ()&\[\]{};><|$`\'"])')
+
+# Whitespace cleanup for text extracted from HTML responses: double spaces
+# and any str.splitlines() line boundary start a new line
+_HTML_GAP_RE = re.compile(r' {2,}')
+_HTML_BLANK_LINES_RE = re.compile(r'\s*[\n\r\v\f\x1c-\x1e\x85\u2028\u2029]\s*')
+
+# CSS classes that usually hold the interesting part of an HTML error page
+_HTML_ERROR_CLASS_RE = re.compile(r'error|message|alert|warning', re.IGNORECASE)
+
+# Status line color and prefix by status code class (status_code // 100)
+_STATUS_TABLE = {
+    2: (Colors.GREEN, '✓ Success'),
+    4: (Colors.RED, '✗ Client Error'),
+    5: (Colors.RED, '✗ Server Error'),
+}
+
+# Runs of digits that may be too long for orjson to parse as an exact integer
+_BIG_INT_RE = re.compile(rb'\d{19}')
+
+# Where GET responses are cached for ETag revalidation (--cache)
+CACHE_DIR = os.path.join(os.getenv('XDG_CACHE_HOME') or os.path.expanduser('~/.cache'), 'mealie-api')
+
+
+def format_json(response: requests.Response) -> str:
+    """Pretty-print a JSON response, using orjson when it can do so exactly."""
+    # orjson only reads UTF-8, turns integers beyond 64 bits into floats and
+    # rejects NaN/Infinity, so leave those documents to the stdlib parser
+    is_utf8 = (response.encoding or 'utf-8').lower().replace('_', '-') in ('utf-8', 'utf8')
+    if orjson is not None and is_utf8 and not _BIG_INT_RE.search(response.content):
+        try:
+            json_data = orjson.loads(response.content)
+        except orjson.JSONDecodeError:
+            pass
+        else:
+            return orjson.dumps(json_data, option=orjson.OPT_INDENT_2).decode('utf-8')
+    # response.text honours the declared charset
+    return json.dumps(json.loads(response.text), indent=2, ensure_ascii=False)
+
+
+def print_color(color: str, message: str, file: Optional[io.TextIOBase] = None) -> None:
     """Print colored output."""
-    print(f"{color}{message}{Colors.NC}")
+    (file or sys.stdout).write(color + message + Colors.NC + '\n')
 
 
 def show_usage() -> None:
     """Show usage information."""
-    print("Usage: mealie-api.py <endpoint> [json_payload] [http_method] [-m|--multipart] [-r|--raw] [-v|--verbose]")
-    print("   or: mealie-api.py <endpoint> [http_method] [-m|--multipart] [-r|--raw] [-v|--verbose]")
+    print("Usage: mealie-api.py <endpoint> [json_payload] [http_method] [-m|--multipart] [-r|--raw] [-v|--verbose] [-c|--cache]")
+    print("   or: mealie-api.py <endpoint> [http_method] [-m|--multipart] [-r|--raw] [-v|--verbose] [-c|--cache]")
     print("")
     print("Arguments:")
     print("  endpoint      - API endpoint (e.g., recipes, users/self)")
@@ -64,11 +145,13 @@ def show_usage() -> None:
     print("  -r, --raw       - Output raw response without status codes or formatting")
     print("                    useful for piping to other tools or scripts")
     print("  -v, --verbose   - Show detailed HTTP request information for debugging")
+    print("  -c, --cache     - Cache GET responses and revalidate them with ETags")
     print("")
     print("Examples:")
     print("  mealie-api.py recipes")
     print("  mealie-api.py recipes --raw")
     print("  mealie-api.py recipes --verbose")
+    print("  mealie-api.py recipes --cache")
     print("  mealie-api.py recipes '{\"name\":\"My Recipe\"}' POST")
     print("  mealie-api.py recipes/123 '{\"name\":\"Updated Recipe\"}' PUT")
     print("  mealie-api.py recipes/123 DELETE")
@@ -97,6 +180,25 @@ def validate_environment() -> tuple[str, str]:
     return mealie_url.rstrip('/'), mealie_token
 
 
+def mask_authorization(value: str) -> str:
+    """Mask an Authorization header value, showing only the ends of a bearer token."""
+    if value.startswith('Bearer '):
+        token = value[7:]  # Remove 'Bearer '
+        masked_token = f"{token[:8]}...{token[-4:]}" if len(token) > 12 else "***"
+        return f"Bearer {masked_token}"
+    return "***"
+
+
+def configure_session(token: str) -> None:
+    """Set the default headers sent with every request on the shared session."""
+    auth = f'Bearer {token}'
+    _SESSION.headers.update({
+        'Authorization': auth,
+        'Accept': 'application/json'
+    })
+    _MASKED_AUTH[auth] = mask_authorization(auth)
+
+
 def build_url(base_url: str, endpoint: str) -> str:
     """Build the full API URL."""
     # Ensure endpoint is properly formatted
@@ -119,23 +221,8 @@ def parse_json_payload(payload: str) -> Optional[Dict[Any, Any]]:
     except json.JSONDecodeError:
         try:
             # If that fails, try to fix common path escape issues
-            # Replace escaped spaces and other common shell escapes
-            fixed_payload = payload.replace('\\ ', ' ')  # Escaped spaces
-            fixed_payload = fixed_payload.replace('\\(', '(')  # Escaped parentheses
-            fixed_payload = fixed_payload.replace('\\)', ')')
-            fixed_payload = fixed_payload.replace('\\&', '&')  # Escaped ampersands
-            fixed_payload = fixed_payload.replace('\\[', '[')  # Escaped brackets
-            fixed_payload = fixed_payload.replace('\\]', ']')
-            fixed_payload = fixed_payload.replace('\\{', '{')  # Escaped braces
-            fixed_payload = fixed_payload.replace('\\}', '}')
-            fixed_payload = fixed_payload.replace('\\;', ';')  # Escaped semicolons
-            fixed_payload = fixed_payload.replace('\\>', '>')  # Escaped redirects
-            fixed_payload = fixed_payload.replace('\\<', '<')
-            fixed_payload = fixed_payload.replace('\\|', '|')  # Escaped pipes
-            fixed_payload = fixed_payload.replace('\\$', '$')  # Escaped dollar signs
-            fixed_payload = fixed_payload.replace('\\`', '`')  # Escaped backticks
-            fixed_payload = fixed_payload.replace('\\\'', '\'')  # Escaped single quotes
-            fixed_payload = fixed_payload.replace('\\"', '"')  # Escaped double quotes (be careful with JSON)
+            # Unescape spaces and other common shell escapes in a single pass
+            fixed_payload = _SHELL_ESCAPE_RE.sub(r'\1', payload)
             
             print_color(Colors.CYAN, f"Fixed shell escapes in JSON payload")
             return json.loads(fixed_payload)
@@ -146,24 +233,29 @@ def parse_json_payload(payload: str) -> Optional[Dict[Any, Any]]:
             sys.exit(1)
 
 
+def _looks_like_file(key: str, value: str, _keys: frozenset = frozenset(('archive', 'file', 'upload', 'attachment'))) -> bool:
+    """Check whether a payload entry should be treated as a file path."""
+    return (
+        key.lower() in _keys or
+        value.startswith(('~/', '/')) or
+        '.' in os.path.basename(value)  # Has file extension
+    )
+
+
 def prepare_file_upload(payload: Dict[Any, Any]) -> Dict[Any, Any]:
     """Convert file paths in payload to actual file objects for upload."""
     files = {}
     data = {}
     
     for key, value in payload.items():
-        if isinstance(value, str) and (
-            key.lower() in ['archive', 'file', 'upload', 'attachment'] or 
-            value.startswith('~/') or 
-            value.startswith('/') or
-            '.' in value.split('/')[-1]  # Has file extension
-        ):
+        if isinstance(value, str) and _looks_like_file(key, value):
             # Expand user path
             file_path = os.path.expanduser(value)
             
             if os.path.isfile(file_path):
                 print_color(Colors.CYAN, f"Adding file upload: {key} -> {file_path}")
-                files[key] = open(file_path, 'rb')
+                content_type = mimetypes.guess_type(file_path)[0] or 'application/octet-stream'
+                files[key] = (os.path.basename(file_path), open(file_path, 'rb'), content_type)
             else:
                 print_color(Colors.RED, f"Error: File not found: {file_path}")
                 sys.exit(1)
@@ -173,6 +265,25 @@ def prepare_file_upload(payload: Dict[Any, Any]) -> Dict[Any, Any]:
     return {'files': files, 'data': data}
 
 
+def build_multipart_fields(data: Dict[Any, Any], files: Dict[Any, Any]) -> list:
+    """Build MultipartEncoder fields, normalizing form values the same way requests does."""
+    fields = []
+    for key, value in data.items():
+        # Drop None values and send lists as repeated fields
+        values = [value] if isinstance(value, (str, bytes)) or not hasattr(value, '__iter__') else value
+        fields.extend((key, v if isinstance(v, bytes) else str(v)) for v in values if v is not None)
+    fields.extend(files.items())
+    return fields
+
+
+def encode_json_body(payload: Dict[Any, Any]) -> bytes:
+    """Serialize a JSON request body, rejecting NaN/Infinity like requests' json= does."""
+    try:
+        return json.dumps(payload, allow_nan=False).encode('utf-8')
+    except ValueError as e:
+        raise requests.exceptions.InvalidJSONError(e)
+
+
 def determine_method(payload: Optional[Dict[Any, Any]], method: Optional[str]) -> str:
     """Determine HTTP method."""
     if method:
@@ -185,70 +296,68 @@ def determine_method(payload: Optional[Dict[Any, Any]], method: Optional[str]) -
 
 def print_verbose_request(url: str, method: str, headers: Dict[str, str], payload: Optional[Dict[Any, Any]], multipart: bool = False) -> None:
     """Print detailed request information for debugging."""
-    print_color(Colors.BLUE, "=== HTTP REQUEST DEBUG INFO ===")
-    print(f"URL: {url}")
-    print(f"Method: {method}")
-    print(f"Timeout: 30 seconds")
-    print(f"Content Type: {'multipart/form-data' if multipart else 'application/json'}")
-    print()
+    # Collect everything first so the block goes out in a single write
+    buf = io.StringIO()
+    print_color(Colors.BLUE, "=== HTTP REQUEST DEBUG INFO ===", file=buf)
+    print(f"URL: {url}", file=buf)
+    print(f"Method: {method}", file=buf)
+    print(f"Timeout: 30 seconds", file=buf)
+    print(f"Content Type: {'multipart/form-data' if multipart else 'application/json'}", file=buf)
+    print(file=buf)
     
-    print_color(Colors.YELLOW, "Headers:")
+    print_color(Colors.YELLOW, "Headers:", file=buf)
     for key, value in headers.items():
-        # Mask the token for security but show its length
-        if key.lower() == 'authorization' and value.startswith('Bearer '):
-            token = value[7:]  # Remove 'Bearer '
-            masked_token = f"{token[:8]}...{token[-4:]}" if len(token) > 12 else "***"
-            print(f"  {key}: Bearer {masked_token}")
-        else:
-            print(f"  {key}: {value}")
-    print()
+        # Never show the token itself
+        if key.lower() == 'authorization':
+            value = _MASKED_AUTH.get(value) or mask_authorization(value)
+        print(f"  {key}: {value}", file=buf)
+    print(file=buf)
     
     if payload:
         if multipart:
-            print_color(Colors.YELLOW, "Request Body (Multipart Form Data):")
+            print_color(Colors.YELLOW, "Request Body (Multipart Form Data):", file=buf)
             for key, value in payload.items():
-                if isinstance(value, str) and (
-                    key.lower() in ['archive', 'file', 'upload', 'attachment'] or 
-                    value.startswith('~/') or 
-                    value.startswith('/') or
-                    '.' in value.split('/')[-1]
-                ):
+                if isinstance(value, str) and _looks_like_file(key, value):
                     file_path = os.path.expanduser(value)
                     if os.path.isfile(file_path):
                         file_size = os.path.getsize(file_path)
                         size_str = f"{file_size / 1024:.2f} KB" if file_size > 1024 else f"{file_size} bytes"
-                        print(f"  {key}: {file_path} ({size_str})")
+                        print(f"  {key}: {file_path} ({size_str})", file=buf)
                     else:
-                        print(f"  {key}: {value} (FILE NOT FOUND)")
+                        print(f"  {key}: {value} (FILE NOT FOUND)", file=buf)
                 else:
-                    print(f"  {key}: {value}")
+                    print(f"  {key}: {value}", file=buf)
         else:
-            print_color(Colors.YELLOW, "Request Body (JSON):")
-            print(json.dumps(payload, indent=2))
-        print()
+            print_color(Colors.YELLOW, "Request Body (JSON):", file=buf)
+            print(json.dumps(payload, indent=2), file=buf)
+        print(file=buf)
     else:
-        print_color(Colors.YELLOW, "Request Body: (empty)")
-        print()
+        print_color(Colors.YELLOW, "Request Body: (empty)", file=buf)
+        print(file=buf)
+
+    sys.stdout.write(buf.getvalue())
 
 
 def print_verbose_response(response: requests.Response) -> None:
     """Print detailed response information for debugging."""
-    print_color(Colors.BLUE, "=== HTTP RESPONSE DEBUG INFO ===")
-    print(f"Status Code: {response.status_code}")
-    print(f"Reason: {response.reason}")
-    print(f"URL: {response.url}")
+    # Collect everything first so the block goes out in a single write
+    buf = io.StringIO()
+    print_color(Colors.BLUE, "=== HTTP RESPONSE DEBUG INFO ===", file=buf)
+    print(f"Status Code: {response.status_code}", file=buf)
+    print(f"Reason: {response.reason}", file=buf)
+    print(f"URL: {response.url}", file=buf)
     
     # Calculate and display response time if available
     if hasattr(response, 'elapsed'):
         elapsed_ms = response.elapsed.total_seconds() * 1000
-        print(f"Response Time: {elapsed_ms:.2f}ms")
+        print(f"Response Time: {elapsed_ms:.2f}ms", file=buf)
     
-    print()
+    print(file=buf)
     
-    print_color(Colors.YELLOW, "Response Headers:")
+    print_color(Colors.YELLOW, "Response Headers:", file=buf)
     for key, value in response.headers.items():
-        print(f"  {key}: {value}")
-    print()
+        print(f"  {key}: {value}", file=buf)
+    print(file=buf)
     
     # Show response size
     content_length = len(response.content)
@@ -256,12 +365,112 @@ def print_verbose_response(response: requests.Response) -> None:
         size_str = f"{content_length / 1024:.2f} KB"
     else:
         size_str = f"{content_length} bytes"
-    print(f"Response Size: {size_str}")
-    print()
+    print(f"Response Size: {size_str}", file=buf)
+    print(file=buf)
 
+    sys.stdout.write(buf.getvalue())
 
-def make_request(url: str, method: str, headers: Dict[str, str], payload: Optional[Dict[Any, Any]], multipart: bool = False) -> requests.Response:
+
+def cache_path(url: str) -> str:
+    """Get the cache file path for a URL."""
+    return os.path.join(CACHE_DIR, hashlib.sha256(url.encode('utf-8')).hexdigest())
+
+
+def load_cache_entry(url: str, read_body: bool = True) -> Optional[tuple[Dict[str, str], bytes]]:
+    """Load the cached metadata and body for a URL, if there is a cache entry."""
+    # Entries are a JSON metadata line followed by the body, so a single
+    # atomic write always keeps the ETag and body in sync
+    try:
+        with open(cache_path(url), 'rb') as f:
+            meta = json.loads(f.readline())
+            body = f.read() if read_body else b''
+    except (OSError, ValueError):
+        return None
+    return meta, body
+
+
+def write_cache_file(path: str, data: bytes) -> None:
+    """Atomically write a cache file readable only by the current user."""
+    # mkstemp gives each concurrent writer its own 0600 temp file
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def add_cache_headers(url: str, headers: Dict[str, str]) -> None:
+    """Add an If-None-Match header when there is a cached ETag for the URL."""
+    entry = load_cache_entry(url, read_body=False)
+    if entry and entry[0].get('etag'):
+        headers['If-None-Match'] = entry[0]['etag']
+
+
+def update_cache(url: str, response: requests.Response) -> requests.Response:
+    """Serve the cached body for a 304 response, or store a new cacheable response."""
+    if response.status_code == 304:
+        sent_etag = response.request.headers.get('If-None-Match')
+        entry = load_cache_entry(url)
+        if entry is None or entry[0].get('etag') != sent_etag:
+            if sent_etag is None:
+                return response
+            # Another run replaced or removed the entry since the request was
+            # sent, so fetch the body again unconditionally
+            retry = response.request.copy()
+            del retry.headers['If-None-Match']
+            response.close()
+            return update_cache(url, _SESSION.send(retry, timeout=30, stream=True))
+        meta, body = entry
+
+        # Build a response that serves the cached body
+        cached = requests.Response()
+        cached.status_code = 200
+        cached.reason = 'OK (cached, not modified)'
+        cached.url = response.url
+        cached.request = response.request
+        cached.elapsed = response.elapsed
+        cached.headers.update(response.headers)
+        cached.headers.pop('Content-Length', None)
+        cached.headers.pop('Content-Encoding', None)
+        if meta.get('content_type'):
+            cached.headers['Content-Type'] = meta['content_type']
+        cached.encoding = requests.utils.get_encoding_from_headers(cached.headers)
+        cached.raw = io.BytesIO(body)
+        response.close()
+        return cached
+
+    etag = response.headers.get('ETag')
+    no_store = 'no-store' in response.headers.get('Cache-Control', '').lower()
+    if 200 <= response.status_code < 300 and etag and not no_store:
+        # Read the body outside the try below; connection errors are
+        # OSErrors too and must not be mistaken for a failed cache write
+        content = response.content
+
+        # Caching is best-effort; a failed write shouldn't fail the request
+        try:
+            # Cached responses are authenticated API data, so keep them private
+            os.makedirs(CACHE_DIR, mode=0o700, exist_ok=True)
+            os.chmod(CACHE_DIR, 0o700)
+
+            meta = json.dumps({
+                'url': url,
+                'etag': etag,
+                'content_type': response.headers.get('Content-Type', '')
+            })
+            write_cache_file(cache_path(url), meta.encode('utf-8') + b'\n' + content)
+        except OSError:
+            pass
+
+    return response
+
+
+def make_request(url: str, method: str, headers: Dict[str, str], payload: Optional[Dict[Any, Any]], multipart: bool = False, body: Optional[bytes] = None) -> requests.Response:
     """Make the HTTP request."""
+    # Responses are streamed so large bodies aren't buffered up front;
+    # the caller is responsible for closing the returned response
     try:
         if method in ['POST', 'PUT', 'PATCH'] and payload is not None:
             if multipart:
@@ -273,17 +482,35 @@ def make_request(url: str, method: str, headers: Dict[str, str], payload: Option
                 # Remove Content-Type header to let requests set multipart boundary
                 multipart_headers = {k: v for k, v in headers.items() if k.lower() != 'content-type'}
                 
+                # Streaming only matters for file uploads; without files requests
+                # sends the form urlencoded, so keep that path for every install.
+                # Imported here to keep it off the startup path of other calls.
+                MultipartEncoder = None
+                if files:
+                    try:
+                        from requests_toolbelt import MultipartEncoder
+                    except ImportError:
+                        pass
+
                 try:
-                    response = requests.request(method, url, headers=multipart_headers, files=files, data=data, timeout=30)
+                    if MultipartEncoder is not None:
+                        # Stream the body in chunks instead of building it in memory
+                        encoder = MultipartEncoder(fields=build_multipart_fields(data, files))
+                        multipart_headers['Content-Type'] = encoder.content_type
+                        response = _SESSION.request(method, url, headers=multipart_headers, data=encoder, timeout=30, stream=True)
+                    else:
+                        response = _SESSION.request(method, url, headers=multipart_headers, files=files, data=data, timeout=30, stream=True)
                 finally:
-                    # Close any opened files
-                    for file_obj in files.values():
-                        if hasattr(file_obj, 'close'):
-                            file_obj.close()
+                    # Close any opened files, even if the request failed
+                    for _, file_obj, _ in files.values():
+                        file_obj.close()
             else:
-                response = requests.request(method, url, headers=headers, json=payload, timeout=30)
+                # Send pre-serialized JSON rather than letting requests encode it again
+                if body is None:
+                    body = encode_json_body(payload)
+                response = _SESSION.request(method, url, headers=headers, data=body, timeout=30, stream=True)
         else:
-            response = requests.request(method, url, headers=headers, timeout=30)
+            response = _SESSION.request(method, url, headers=headers, timeout=30, stream=True)
         return response
     except requests.exceptions.RequestException as e:
         print_color(Colors.RED, f"✗ Request failed: {e}")
@@ -292,8 +519,21 @@ def make_request(url: str, method: str, headers: Dict[str, str], payload: Option
 
 def format_html_response(html_content: str) -> str:
     """Parse and format HTML response for better readability."""
+    # Bodies without any markup have nothing to parse
+    if '<' not in html_content:
+        return html_content.strip()
+
+    # Imported here since HTML responses are rare and bs4 is slow to import
+    from bs4 import BeautifulSoup, FeatureNotFound
+
+    # Only a short excerpt is displayed, so bound how much HTML gets parsed
+    markup = html_content[:64_000]
+
     try:
-        soup = BeautifulSoup(html_content, 'html.parser')
+        try:
+            soup = BeautifulSoup(markup, 'lxml')
+        except FeatureNotFound:
+            soup = BeautifulSoup(markup, 'html.parser')
 
         # Try to extract meaningful content
         title = soup.find('title')
@@ -303,9 +543,7 @@ def format_html_response(html_content: str) -> str:
             result = ""
 
         # Look for error messages or main content
-        error_divs = soup.find_all(['div', 'p', 'span'], class_=lambda x: bool(x and any(
-            keyword in x.lower() for keyword in ['error', 'message', 'alert', 'warning']
-        )))
+        error_divs = soup.find_all(['div', 'p', 'span'], class_=_HTML_ERROR_CLASS_RE)
 
         if error_divs:
             result += "Error/Message content:\n"
@@ -323,9 +561,8 @@ def format_html_response(html_content: str) -> str:
 
                 text = body.get_text()
                 # Clean up whitespace
-                lines = (line.strip() for line in text.splitlines())
-                chunks = (phrase.strip() for line in lines for phrase in line.split("  "))
-                clean_text = '\n'.join(chunk for chunk in chunks if chunk)
+                clean_text = _HTML_GAP_RE.sub('\n', text)
+                clean_text = _HTML_BLANK_LINES_RE.sub('\n', clean_text).strip()
 
                 # Limit length for readability
                 if len(clean_text) > 500:
@@ -346,22 +583,22 @@ def format_response(response: requests.Response, raw_output: bool = False, verbo
         print_verbose_response(response)
     
     if raw_output:
-        # Raw output - just print the response body
-        print(response.text, end='')
+        # Raw output - write the body bytes as-is, skipping charset decoding
+        sys.stdout.flush()
+        for chunk in response.iter_content(65536):
+            sys.stdout.buffer.write(chunk)
+        sys.stdout.buffer.flush()
         return
 
+    # Read the body before printing anything so a dropped connection
+    # doesn't leave a success line behind
+    content = response.text.strip()
+
     # Print status
-    if 200 <= response.status_code < 300:
-        print_color(Colors.GREEN, f"✓ Success (HTTP {response.status_code})")
-    elif 400 <= response.status_code < 500:
-        print_color(Colors.RED, f"✗ Client Error (HTTP {response.status_code})")
-    elif 500 <= response.status_code < 600:
-        print_color(Colors.RED, f"✗ Server Error (HTTP {response.status_code})")
-    else:
-        print_color(Colors.YELLOW, f"! Unexpected Status (HTTP {response.status_code})")
+    color, prefix = _STATUS_TABLE.get(response.status_code // 100, (Colors.YELLOW, '! Unexpected Status'))
+    print_color(color, f"{prefix} (HTTP {response.status_code})")
 
     # Print response body
-    content = response.text.strip()
     if not content:
         if 200 <= response.status_code < 300:
             print_color(Colors.YELLOW, "Success but no response body received")
@@ -377,8 +614,7 @@ def format_response(response: requests.Response, raw_output: bool = False, verbo
     if 'application/json' in content_type:
         # Handle JSON response
         try:
-            json_data = response.json()
-            print(json.dumps(json_data, indent=2, ensure_ascii=False))
+            print(format_json(response))
         except json.JSONDecodeError:
             print_color(Colors.YELLOW, "Response claims to be JSON but is not valid JSON:")
             print(content)
@@ -400,27 +636,21 @@ def main():
     raw_output = False
     verbose = False
     multipart = False
-    args = sys.argv[1:]
-
-    # Remove flags from args
-    if '-r' in args:
-        raw_output = True
-        args.remove('-r')
-    if '--raw' in args:
-        raw_output = True
-        args.remove('--raw')
-    if '-v' in args:
-        verbose = True
-        args.remove('-v')
-    if '--verbose' in args:
-        verbose = True
-        args.remove('--verbose')
-    if '-m' in args:
-        multipart = True
-        args.remove('-m')
-    if '--multipart' in args:
-        multipart = True
-        args.remove('--multipart')
+    cache = False
+    args = []
+
+    # Separate flags from positional args in a single pass
+    for arg in sys.argv[1:]:
+        if arg in ('-r', '--raw'):
+            raw_output = True
+        elif arg in ('-v', '--verbose'):
+            verbose = True
+        elif arg in ('-m', '--multipart'):
+            multipart = True
+        elif arg in ('-c', '--cache'):
+            cache = True
+        else:
+            args.append(arg)
 
     # Check for help
     if len(args) == 0 or args[0] in ['-h', '--help']:
@@ -455,37 +685,62 @@ def main():
 
     # Validate environment
     base_url, token = validate_environment()
+    configure_session(token)
 
     # Build request parameters
     url = build_url(base_url, endpoint)
     payload = parse_json_payload(json_payload_str)
     method = determine_method(payload, http_method)
 
-    headers = {
-        'Authorization': f'Bearer {token}',
-        'Accept': 'application/json'
-    }
-    
+    # Serialize once and reuse for both logging and the request body.
+    # Payloads that aren't valid JSON (NaN/Infinity) are left for
+    # make_request to reject if they're actually sent as JSON.
+    body = None
+    if payload is not None:
+        try:
+            body = encode_json_body(payload)
+        except requests.exceptions.InvalidJSONError:
+            pass
+
+    # Per-request headers; auth and accept headers live on the session
+    headers = {}
+
     # Set content type based on multipart flag
     if not multipart:
         headers['Content-Type'] = 'application/json'
 
+    # Only idempotent GETs are cached
+    use_cache = cache and method == 'GET'
+    if use_cache:
+        add_cache_headers(url, headers)
+
     # Print request info
     if verbose:
-        print_verbose_request(url, method, headers, payload, multipart)
+        print_verbose_request(url, method, {**_SESSION.headers, **headers}, payload, multipart)
     elif not raw_output:
         print_color(Colors.BLUE, f"Making {method} request to: {url}")
         if multipart:
             print_color(Colors.CYAN, f"Content-Type: multipart/form-data")
         if payload:
-            print_color(Colors.YELLOW, f"Payload: {json.dumps(payload)}")
+            payload_str = body.decode('utf-8') if body is not None else json.dumps(payload)
+            print_color(Colors.YELLOW, f"Payload: {payload_str}")
         print()
 
     # Make request
-    response = make_request(url, method, headers, payload, multipart)
+    response = make_request(url, method, headers, payload, multipart, body)
+
+    try:
+        if use_cache:
+            response = update_cache(url, response)
 
-    # Format and display response
-    format_response(response, raw_output, verbose)
+        # Format and display response
+        format_response(response, raw_output, verbose)
+    except requests.exceptions.RequestException as e:
+        # The body is streamed, so connection errors can surface while reading it
+        print_color(Colors.RED, f"✗ Request failed: {e}")
+        sys.exit(1)
+    finally:
+        response.close()
 
     # Exit with appropriate code
     sys.exit(0 if 200 <= response.status_code < 300 else 1)